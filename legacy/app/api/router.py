@@ -260,7 +260,7 @@ async def list_agents(
 ):
     user_id: str = user["user_id"]
     llm_provider = ProviderService(db, user_id)
-    tools_provider = ToolService(db, user_id)
+    tools_provider = ToolService(db, user_id, provider_service=llm_provider)
     prompt_provider = PromptService(db)
     controller = AgentsController(db, llm_provider, prompt_provider, tools_provider)
     return await controller.list_available_agents(user, True)
@@ -4,8 +4,18 @@ from contextlib import asynccontextmanager
 from app.core.database import SessionLocal
 from observability import get_logger
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is unavailable on Windows/PyPy
+    uvloop = None
+
 logger = get_logger(__name__)
 
+# Streaming agent runs are dominated by socket I/O (Redis, LLM HTTP streams);
+# uvloop dispatches it faster than the default selector loop. The API process
+# already gets uvloop through uvicorn's UvicornWorker.
+_LOOP_FACTORY = uvloop.new_event_loop if uvloop is not None else None
+
 
 class BaseTask(Task):
     """
@@ -85,7 +95,7 @@ class BaseTask(Task):
         self.db) or other blocking I/O; do that before calling run_async()
         and pass results into the coroutine (see class docstring).
         """
-        return asyncio.run(coro)
+        return asyncio.run(coro, loop_factory=_LOOP_FACTORY)
 
     def on_success(self, retval, task_id, args, kwargs):
         try:
@@ -71,6 +71,30 @@ from ..message.message_store import MessageStore
 
 logger = get_logger(__name__)
 
+# Single history cap for all agent types (Phase 2: token- and model-aware limits).
+# Derived from process-wide config only, so it is computed once at import.
+# Ensure we never pass empty history due to HISTORY_MESSAGE_CAP=0 or misconfig.
+_HISTORY_MSG_CAP = max(
+    1,
+    min(
+        HISTORY_MESSAGE_CAP,
+        max(8, get_history_token_budget(None) // ESTIMATED_TOKENS_PER_MESSAGE),
+    ),
+)
+
+
+# Upper bound on how long a finished (or aborted) first-message stream waits
+# for its concurrently generated title before giving up on it.
+_TITLE_TASK_TIMEOUT_SECONDS = 15.0
+
+
+def _log_title_task_failure(task: asyncio.Task) -> None:
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.warning("Failed to generate conversation title", exc_info=exc)
+
 
 class ConversationServiceError(Exception):
     pass
@@ -170,7 +194,7 @@ class ConversationService:
         if async_db is not None:
             async_history_manager = AsyncChatHistoryService(async_db)
         provider_service = ProviderService(db, user_id)
-        tool_service = ToolService(db, user_id)
+        tool_service = ToolService(db, user_id, provider_service=provider_service)
         prompt_service = PromptService(db)
         agent_service = AgentsService(
             db, provider_service, prompt_service, tool_service
@@ -883,13 +907,6 @@ class ConversationService:
                         f"Conversation with id {conversation_id} not found"
                     )
 
-                # Check if this is the first human message
-                if conversation.human_message_count == 1:
-                    new_title = await self._generate_title(
-                        conversation, message.content
-                    )
-                    await self._update_conversation_title(conversation_id, new_title)
-
                 project_id = (
                     conversation.project_ids[0] if conversation.project_ids else None
                 )
@@ -898,85 +915,107 @@ class ConversationService:
                         "No project associated with this conversation"
                     )
 
-                # Verify the project sandbox is alive before the
-                # agent runs its first tool call. ``ensure()`` is the
-                # health check — it acquires (cheap on cache hit),
-                # probes ``is_alive``, and recovers if the backing
-                # storage was archived/deleted out-of-band. So the
-                # happy path is one ``acquire_session`` cache hit plus
-                # one cheap probe; the heavy recovery work only fires
-                # when the sandbox is actually gone.
-                #
-                # Skipped in local/VSCode mode — the IDE tunnel reads
-                # straight from the user's filesystem.
-                project_id_str = str(project_id) if project_id else None
-                if project_id_str and not local_mode:
-                    needs_clone = await asyncio.get_running_loop().run_in_executor(
-                        None, self._needs_full_clone_sync, project_id_str
-                    )
-                    if needs_clone and stream:
-                        yield ChatMessageResponse(
-                            message="⏳ Setting up repository workspace, please wait...",
-                            citations=[],
-                            tool_calls=[],
-                        )
-                    # Bounded so a slow recovery (Daytona sandbox
-                    # creation can take ~10s) doesn't stall the user
-                    # past a reasonable budget; if it overruns, the
-                    # subsequent agent tool will pay the cost on its
-                    # own ensure() call. 30s gives a fresh Daytona
-                    # sandbox enough time to reach RUNNING without
-                    # holding the request open indefinitely.
-                    await self._ensure_project_sandbox_safe(
-                        project_id_str, user_id, timeout_s=30.0
+                # On the first human message, generate the title alongside
+                # the sandbox check and the answer stream instead of paying
+                # for a separate LLM round trip before the agent starts. It is
+                # persisted once the stream no longer holds the session, and
+                # also when the answer errors or is stopped: titles are only
+                # generated for the first message, so a skipped save would
+                # leave the conversation untitled for good.
+                title_task: Optional[asyncio.Task] = None
+                if conversation.human_message_count == 1:
+                    title_task = asyncio.create_task(
+                        self._generate_title(conversation, message.content)
                     )
+                    title_task.add_done_callback(_log_title_task_failure)
 
-                logger.info(
-                    f"[store_message] message.tunnel_url={message.tunnel_url}, "
-                    f"conversation_id={conversation_id}, user_id={user_id}",
-                    message_tunnel_url=message.tunnel_url,
-                    conversation_id=conversation_id,
-                    user_id=user_id,
-                )
-                if stream:
-                    async for chunk in self._generate_and_stream_ai_response(
-                        message.content,
-                        conversation_id,
-                        user_id,
-                        message.node_ids,
-                        message.attachment_ids,
-                        local_mode=local_mode,
-                        tunnel_url=message.tunnel_url,
-                        run_id=run_id,
-                        check_cancelled=check_cancelled,
-                    ):
-                        yield chunk
-                else:
-                    full_message = ""
-                    all_citations = []
-                    accumulated_thinking = None
-                    async for chunk in self._generate_and_stream_ai_response(
-                        message.content,
-                        conversation_id,
-                        user_id,
-                        message.node_ids,
-                        message.attachment_ids,
-                        local_mode=local_mode,
-                        tunnel_url=message.tunnel_url,
-                        run_id=run_id,
-                        check_cancelled=check_cancelled,
-                    ):
-                        full_message += chunk.message
-                        all_citations = all_citations + chunk.citations
-                        if chunk.thinking:
-                            accumulated_thinking = chunk.thinking
+                try:
+                    # Verify the project sandbox is alive before the
+                    # agent runs its first tool call. ``ensure()`` is the
+                    # health check — it acquires (cheap on cache hit),
+                    # probes ``is_alive``, and recovers if the backing
+                    # storage was archived/deleted out-of-band. So the
+                    # happy path is one ``acquire_session`` cache hit plus
+                    # one cheap probe; the heavy recovery work only fires
+                    # when the sandbox is actually gone.
+                    #
+                    # Skipped in local/VSCode mode — the IDE tunnel reads
+                    # straight from the user's filesystem.
+                    project_id_str = str(project_id) if project_id else None
+                    if project_id_str and not local_mode:
+                        needs_clone = await asyncio.get_running_loop().run_in_executor(
+                            None, self._needs_full_clone_sync, project_id_str
+                        )
+                        if needs_clone and stream:
+                            yield ChatMessageResponse(
+                                message="⏳ Setting up repository workspace, please wait...",
+                                citations=[],
+                                tool_calls=[],
+                            )
+                        # Bounded so a slow recovery (Daytona sandbox
+                        # creation can take ~10s) doesn't stall the user
+                        # past a reasonable budget; if it overruns, the
+                        # subsequent agent tool will pay the cost on its
+                        # own ensure() call. 30s gives a fresh Daytona
+                        # sandbox enough time to reach RUNNING without
+                        # holding the request open indefinitely.
+                        await self._ensure_project_sandbox_safe(
+                            project_id_str, user_id, timeout_s=30.0
+                        )
 
-                    yield ChatMessageResponse(
-                        message=full_message,
-                        citations=all_citations,
-                        tool_calls=[],
-                        thinking=accumulated_thinking,
+                    logger.info(
+                        f"[store_message] message.tunnel_url={message.tunnel_url}, "
+                        f"conversation_id={conversation_id}, user_id={user_id}",
+                        message_tunnel_url=message.tunnel_url,
+                        conversation_id=conversation_id,
+                        user_id=user_id,
                     )
+                    if stream:
+                        async for chunk in self._generate_and_stream_ai_response(
+                            message.content,
+                            conversation_id,
+                            user_id,
+                            message.node_ids,
+                            message.attachment_ids,
+                            local_mode=local_mode,
+                            tunnel_url=message.tunnel_url,
+                            run_id=run_id,
+                            check_cancelled=check_cancelled,
+                        ):
+                            yield chunk
+                        await self._persist_generated_title(conversation_id, title_task)
+                        title_task = None
+                    else:
+                        full_message = ""
+                        all_citations = []
+                        accumulated_thinking = None
+                        async for chunk in self._generate_and_stream_ai_response(
+                            message.content,
+                            conversation_id,
+                            user_id,
+                            message.node_ids,
+                            message.attachment_ids,
+                            local_mode=local_mode,
+                            tunnel_url=message.tunnel_url,
+                            run_id=run_id,
+                            check_cancelled=check_cancelled,
+                        ):
+                            full_message += chunk.message
+                            all_citations.extend(chunk.citations)
+                            if chunk.thinking:
+                                accumulated_thinking = chunk.thinking
+
+                        await self._persist_generated_title(conversation_id, title_task)
+                        title_task = None
+                        yield ChatMessageResponse(
+                            message=full_message,
+                            citations=all_citations,
+                            tool_calls=[],
+                            thinking=accumulated_thinking,
+                        )
+                finally:
+                    if title_task is not None:
+                        await self._persist_generated_title(conversation_id, title_task)
 
         except AccessTypeReadError:
             raise
@@ -1021,6 +1060,38 @@ class ConversationService:
     async def _update_conversation_title(self, conversation_id: str, new_title: str):
         await self.conversation_store.update_title(conversation_id, new_title)
 
+    async def _persist_generated_title(
+        self, conversation_id: str, title_task: Optional[asyncio.Task]
+    ) -> None:
+        """Store the title produced by a background title task, if any.
+
+        Waits at most _TITLE_TASK_TIMEOUT_SECONDS for the task. A failed title
+        generation is logged by the task's done callback, and neither it nor a
+        failed save may fail (or mask the error of) the message itself.
+        """
+        if title_task is None or title_task.cancelled():
+            return
+        try:
+            new_title = await asyncio.wait_for(
+                title_task, timeout=_TITLE_TASK_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Timed out waiting for conversation title",
+                conversation_id=conversation_id,
+            )
+            return
+        except Exception:
+            return
+        try:
+            await self._update_conversation_title(conversation_id, new_title)
+        except Exception:
+            logger.warning(
+                "Failed to persist conversation title",
+                conversation_id=conversation_id,
+                exc_info=True,
+            )
+
     async def regenerate_last_message(
         self,
         conversation_id: str,
@@ -1106,7 +1177,7 @@ class ConversationService:
                     tunnel_url=None,
                 ):
                     full_message += chunk.message
-                    all_citations = all_citations + chunk.citations
+                    all_citations.extend(chunk.citations)
                     if chunk.thinking:
                         accumulated_thinking = chunk.thinking
 
@@ -1262,9 +1333,11 @@ class ConversationService:
 
         try:
             history = await self._history_get_session_history(user_id, conversation_id)
-            validated_history = [
+            # Only the last _HISTORY_MSG_CAP messages reach the agent, so cap
+            # first and format just that tail instead of the whole conversation.
+            capped_history = [
                 (f"{msg.type}: {msg.content}" if msg.content else msg)
-                for msg in history
+                for msg in history[-_HISTORY_MSG_CAP:]
             ]
 
         except Exception:
@@ -1331,15 +1404,8 @@ class ConversationService:
                     f"Multimodal context: {len(image_attachments) if image_attachments else 0} current images, {len(context_images) if context_images else 0} context images"
                 )
 
-            # Single history cap for all agent types (Phase 2: token- and model-aware limits)
-            token_budget = get_history_token_budget(None)
-            msg_cap = min(
-                HISTORY_MESSAGE_CAP,
-                max(8, token_budget // ESTIMATED_TOKENS_PER_MESSAGE),
-            )
-            # Ensure we never pass empty history due to HISTORY_MESSAGE_CAP=0 or misconfig
-            msg_cap = max(1, msg_cap)
-            capped_history = validated_history[-msg_cap:]
+            # Both agent paths take plain node ids; extract them once.
+            nodes = [node.node_id for node in node_ids] if node_ids else []
 
             if type == "CUSTOM_AGENT":
                 custom_ctx = ChatContext(
@@ -1347,7 +1413,7 @@ class ConversationService:
                     project_name=project_name,
                     curr_agent_id=str(agent_id),
                     history=capped_history,
-                    node_ids=[node.node_id for node in node_ids],
+                    node_ids=nodes,
                     query=query,
                     project_status=project_status,
                     conversation_id=conversation_id,
@@ -1404,9 +1470,7 @@ class ConversationService:
                     yield ChatMessageResponse(
                         message=chunk.response,
                         citations=chunk.citations,
-                        tool_calls=[
-                            tool_call.model_dump() for tool_call in chunk.tool_calls
-                        ],
+                        tool_calls=chunk_tool_calls or [],
                         thinking=chunk.thinking,
                     )
                 await self._history_flush_message_buffer(
@@ -1414,7 +1478,6 @@ class ConversationService:
                 )
             else:
                 # Create enhanced ChatContext with multimodal support
-                nodes = [] if node_ids is None else [node.node_id for node in node_ids]
                 chat_context = ChatContext(
                     project_id=str(project_id),
                     project_name=project_name,
@@ -1475,9 +1538,7 @@ class ConversationService:
                     yield ChatMessageResponse(
                         message=chunk.response,
                         citations=chunk.citations,
-                        tool_calls=[
-                            tool_call.model_dump() for tool_call in chunk.tool_calls
-                        ],
+                        tool_calls=chunk_tool_calls or [],
                         thinking=chunk.thinking,
                     )
                 await self._history_flush_message_buffer(
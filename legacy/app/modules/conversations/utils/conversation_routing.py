@@ -6,7 +6,7 @@ Contains common functions for session management, Redis streaming, and Celery ta
 import asyncio
 import json
 import uuid
-from typing import Generator, Optional
+from typing import AsyncGenerator, Optional
 from observability import get_logger
 
 from fastapi import HTTPException
@@ -216,10 +216,15 @@ async def async_ensure_unique_run_id(
         counter += 1
 
 
-def redis_stream_generator(
+async def redis_stream_generator(
     conversation_id: str, run_id: str, cursor: Optional[str] = None
-) -> Generator[str, None, None]:
-    """Stream events from Redis to client"""
+) -> AsyncGenerator[str, None]:
+    """Stream events from Redis to client.
+
+    Consumes the stream with redis.asyncio on the event loop, so each chunk is
+    delivered without a threadpool hop. A dedicated client is used per stream
+    because the blocking XREAD holds its connection for the stream's lifetime.
+    """
 
     def json_serializer(obj):
         """Custom JSON serializer to handle bytes objects"""
@@ -227,7 +232,7 @@ def redis_stream_generator(
             return obj.decode("utf-8", errors="replace")
         return str(obj)
 
-    redis_manager = RedisStreamManager()
+    redis_manager = AsyncRedisStreamManager(max_connections=1)
     logger.info(
         f"Stream consumer started for {conversation_id}:{run_id}, waiting for events",
         conversation_id=conversation_id,
@@ -235,7 +240,9 @@ def redis_stream_generator(
     )
 
     try:
-        for event in redis_manager.consume_stream(conversation_id, run_id, cursor):
+        async for event in redis_manager.consume_stream(
+            conversation_id, run_id, cursor
+        ):
             # Convert to ChatMessageResponse format for compatibility
             if event.get("type") == "chunk":
                 tool_calls = event.get("tool_calls", [])
@@ -267,6 +274,18 @@ def redis_stream_generator(
     except Exception as e:
         logger.error(f"Redis streaming error: {str(e)}")
         # Don't yield error events to match original behavior
+    finally:
+        # Shielded so the connection is released even when the client
+        # disconnects and the response task is cancelled.
+        try:
+            await asyncio.shield(redis_manager.aclose())
+        except Exception:
+            logger.warning(
+                f"Failed to close Redis stream client for {conversation_id}:{run_id}",
+                conversation_id=conversation_id,
+                run_id=run_id,
+                exc_info=True,
+            )
 
 
 async def start_celery_task_and_stream(
@@ -353,7 +372,7 @@ async def start_celery_task_and_stream(
             run_id=run_id,
         )
 
-    # Return Redis stream response (sync generator runs in Starlette thread pool)
+    # Return Redis stream response (async generator, consumed on the event loop)
     return StreamingResponse(
         redis_stream_generator(conversation_id, run_id, cursor),
         media_type="text/event-stream",
@@ -438,7 +457,7 @@ async def start_celery_task_and_wait(
 ) -> ChatMessageResponse:
     """
     Start a Celery background task and wait for the complete response.
-    Uses async Redis for setup; stream collection runs in thread pool.
+    Uses async Redis for both setup and stream collection.
     """
     # Set initial "queued" status before starting the task
     await async_redis_manager.set_task_status(conversation_id, run_id, "queued")
@@ -488,80 +507,59 @@ async def start_celery_task_and_wait(
             run_id=run_id,
         )
 
-    # Collect all chunks from the stream (sync consume_stream in thread pool)
-    full_message = ""
+    # Fold events into the response as they arrive on the event loop instead
+    # of buffering them in a worker thread and re-scanning afterwards.
+    message_parts: list[str] = []
     all_citations = []
     all_tool_calls = []
     error_message = None
-    sync_redis = RedisStreamManager()
-
-    def collect_from_stream():
-        """Synchronous function to collect all events from Redis stream"""
-        events = []
-        try:
-            for event in sync_redis.consume_stream(conversation_id, run_id):
-                events.append(event)
-                # Stop collecting when we get an end event
-                if event.get("type") == "end":
-                    break
-        except Exception as e:
-            logger.error(
-                f"Error consuming Redis stream for {conversation_id}:{run_id}: {str(e)}",
-                exc_info=True,
-            )
-            # Add error event to signal failure
-            events.append(
-                {
-                    "type": "end",
-                    "status": "error",
-                    "message": f"Stream error: {str(e)}",
-                }
-            )
-        return events
+    stream_manager = AsyncRedisStreamManager(max_connections=1)
 
     try:
-        # Run stream consumption in thread pool to avoid blocking event loop
-        events = await asyncio.to_thread(collect_from_stream)
-
-        # Process collected events
-        for event in events:
-            if event.get("type") == "chunk":
-                # Accumulate message content
-                content = event.get("content", "")
-                if content:
-                    full_message += content
+        try:
+            async for event in stream_manager.consume_stream(conversation_id, run_id):
+                if event.get("type") == "chunk":
+                    content = event.get("content", "")
+                    if content:
+                        message_parts.append(content)
 
-                # Accumulate citations (avoid duplicates)
-                citations = event.get("citations", [])
-                if citations:
                     # Merge citations, avoiding duplicates
-                    for citation in citations:
+                    for citation in event.get("citations") or []:
                         if citation not in all_citations:
                             all_citations.append(citation)
 
-                # Accumulate tool calls
-                tool_calls = event.get("tool_calls", [])
-                if tool_calls:
-                    all_tool_calls.extend(tool_calls)
-
-            elif event.get("type") == "end":
-                status = event.get("status", "completed")
-                if status == "error":
-                    error_message = event.get("message", "Unknown error occurred")
-                    logger.error(
-                        f"Task completed with error for {conversation_id}:{run_id}: {error_message}",
-                        conversation_id=conversation_id,
-                        run_id=run_id,
-                        error_message=error_message,
-                    )
-                elif status == "cancelled":
-                    error_message = "Task was cancelled"
-                    logger.info(
-                        f"Task cancelled for {conversation_id}:{run_id}",
-                        conversation_id=conversation_id,
-                        run_id=run_id,
-                    )
-                break
+                    tool_calls = event.get("tool_calls", [])
+                    if tool_calls:
+                        all_tool_calls.extend(tool_calls)
+
+                elif event.get("type") == "end":
+                    status = event.get("status", "completed")
+                    if status == "error":
+                        error_message = event.get("message", "Unknown error occurred")
+                        logger.error(
+                            f"Task completed with error for {conversation_id}:{run_id}: {error_message}",
+                            conversation_id=conversation_id,
+                            run_id=run_id,
+                            error_message=error_message,
+                        )
+                    elif status == "cancelled":
+                        error_message = "Task was cancelled"
+                        logger.info(
+                            f"Task cancelled for {conversation_id}:{run_id}",
+                            conversation_id=conversation_id,
+                            run_id=run_id,
+                        )
+                    break
+        finally:
+            try:
+                await asyncio.shield(stream_manager.aclose())
+            except Exception:
+                logger.warning(
+                    f"Failed to close Redis stream client for {conversation_id}:{run_id}",
+                    conversation_id=conversation_id,
+                    run_id=run_id,
+                    exc_info=True,
+                )
 
         # If we got an error, raise an exception
         if error_message:
@@ -569,7 +567,7 @@ async def start_celery_task_and_wait(
 
         # Return the complete response
         return ChatMessageResponse(
-            message=full_message,
+            message="".join(message_parts),
             citations=all_citations,
             tool_calls=all_tool_calls,
         )
@@ -3,7 +3,7 @@ import json
 import redis
 import time
 from datetime import datetime
-from typing import Generator, Optional
+from typing import AsyncGenerator, Optional
 
 from app.core.config_provider import ConfigProvider
 from observability import get_logger
@@ -11,8 +11,101 @@ from app.modules.intelligence.provider.openrouter_usage_context import (
     estimate_cost_for_log,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with the langchain stack
+    orjson = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+# Datetimes and dataclasses go through _json_default (str()) so the encoded
+# payload matches what json.dumps(default=...) produced before.
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+
+def _json_default(x):
+    if isinstance(x, bytes):
+        return x.decode("utf-8", errors="replace")
+    return str(x)
+
+
+def _dumps_json(v) -> str:
+    """Encode a stream payload value; orjson when available (C, per chunk).
+
+    Whichever library encodes also decodes (see ``_loads_json``), so values
+    round-trip unchanged. orjson's limits apply to payloads: integers wider
+    than 64 bits raise ``orjson.JSONEncodeError`` and NaN/Infinity are
+    written as ``null``.
+    """
+    if orjson is not None:
+        return orjson.dumps(v, default=_json_default, option=_ORJSON_OPTIONS).decode(
+            "utf-8"
+        )
+    return json.dumps(v, default=_json_default)
+
+
+def _loads_json(value):
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+def _serialize_stream_value(v) -> str:
+    if isinstance(v, bytes):
+        return v.decode("utf-8", errors="replace")
+    if isinstance(v, (dict, list)):
+        return _dumps_json(v)
+    return str(v)
+
+
+def _log_stream_usage(event: dict) -> None:
+    """Log OpenRouter usage/cost from an end event so it appears in the API logs."""
+    usage_list = event.get("usage") or event.get("usage_json")
+    if usage_list and isinstance(usage_list, list):
+        total_cost = 0.0
+        for u in usage_list:
+            if isinstance(u, dict):
+                c = u.get("cost")
+                pt = u.get("prompt_tokens", 0) or 0
+                ct = u.get("completion_tokens", 0) or 0
+                if c is not None:
+                    try:
+                        cost_val = float(c)
+                        total_cost += cost_val
+                        cost_str = f", cost={cost_val} credits"
+                    except (TypeError, ValueError):
+                        logger.debug("Malformed cost value in stream: %r", c)
+                        cost_str = ""
+                else:
+                    est = estimate_cost_for_log(pt, ct) if (pt or ct) else 0.0
+                    cost_str = f", cost≈{est} credits (estimated)" if (pt or ct) else ""
+                logger.info(
+                    "[OpenRouter usage] model=%s prompt_tokens=%s completion_tokens=%s total_tokens=%s%s"
+                    % (
+                        u.get("model", ""),
+                        pt,
+                        ct,
+                        u.get("total_tokens", 0),
+                        cost_str,
+                    )
+                )
+        if usage_list:
+            logger.info(
+                "[LLM cost this run] total=%s credits (see lines above for per-call breakdown)"
+                % (total_cost,)
+            )
+    else:
+        logger.info(
+            "[LLM cost] no usage data in stream — cost is logged in the Celery worker; "
+            "run worker with -Q staging_agent_tasks to see it (e.g. ./scripts/run_celery_worker.sh)"
+        )
+
 
 class RedisStreamManager:
     def __init__(self):
@@ -40,27 +133,12 @@ class RedisStreamManager:
         # #endregion
         key = self.stream_key(conversation_id, run_id)
 
-        def serialize_value(v):
-            if isinstance(v, bytes):
-                return v.decode("utf-8", errors="replace")
-            elif isinstance(v, (dict, list)):
-                return json.dumps(
-                    v,
-                    default=lambda x: (
-                        x.decode("utf-8", errors="replace")
-                        if isinstance(x, bytes)
-                        else str(x)
-                    ),
-                )
-            else:
-                return str(v)
-
         event_data = {
             "type": event_type,
             "conversation_id": conversation_id,
             "run_id": run_id,
             "created_at": datetime.utcnow().isoformat(),
-            **{k: serialize_value(v) for k, v in payload.items()},
+            **{k: _serialize_stream_value(v) for k, v in payload.items()},
         }
 
         try:
@@ -89,149 +167,6 @@ class RedisStreamManager:
         except Exception:
             raise
 
-    def consume_stream(
-        self, conversation_id: str, run_id: str, cursor: Optional[str] = None
-    ) -> Generator[dict, None, None]:
-        """Synchronous Redis stream consumption for HTTP streaming"""
-        key = self.stream_key(conversation_id, run_id)
-
-        try:
-            # Only replay existing events if cursor is explicitly provided (for reconnection)
-            events = []
-            if cursor:
-                events = self.redis_client.xrange(key, min=cursor, max="+")
-
-                for event_id, event_data in events:
-                    formatted_event = self._format_event(event_id, event_data)
-                    yield formatted_event
-
-            # Set starting point for live events
-            if cursor and events:
-                last_id = events[-1][0]
-            elif not cursor and self.redis_client.exists(key):
-                # Fresh attach: replay from the beginning. Hatchet workers can publish
-                # start/chunk events before the HTTP consumer connects; skipping to the
-                # latest entry drops tool-call and thinking chunks emitted early.
-                existing = self.redis_client.xrange(key, min="-", max="+")
-                for event_id, event_data in existing:
-                    formatted_event = self._format_event(event_id, event_data)
-                    yield formatted_event
-                    if formatted_event.get("type") == "end":
-                        return
-                last_id = existing[-1][0] if existing else "0-0"
-            else:
-                last_id = "0-0"
-
-            # If no cursor provided (fresh request), wait for stream to be created
-            if not cursor and not self.redis_client.exists(key):
-                # Wait for the stream to be created (with timeout)
-                # Increased timeout to 120 seconds to handle queued Celery tasks
-                wait_timeout = 120  # 2 minutes
-                wait_start = datetime.now()
-
-                while not self.redis_client.exists(key):
-                    if (datetime.now() - wait_start).total_seconds() > wait_timeout:
-                        yield {
-                            "type": "end",
-                            "status": "timeout",
-                            "message": "Stream creation timeout - task may be queued",
-                            "stream_id": "0-0",
-                        }
-                        return
-
-                    # Check every 500ms
-                    time.sleep(0.5)
-
-            while True:
-                # Check if key still exists (TTL expiry detection)
-                if not self.redis_client.exists(key):
-                    yield {
-                        "type": "end",
-                        "status": "expired",
-                        "message": "Stream expired",
-                        "stream_id": last_id,
-                    }
-                    return
-
-                events = self.redis_client.xread({key: last_id}, block=5000, count=1)
-                if not events:
-                    continue
-
-                for stream_key, stream_events in events:
-                    for event_id, event_data in stream_events:
-                        last_id = event_id
-                        event = self._format_event(event_id, event_data)
-
-                        # Check for end events
-                        if event.get("type") == "end":
-                            logger.info(
-                                f"Stream {key} ended with status: {event.get('status')}"
-                            )
-                            # Log OpenRouter usage/cost in API (uvicorn) so it appears in FastAPI logs
-                            usage_list = event.get("usage") or event.get("usage_json")
-                            if usage_list and isinstance(usage_list, list):
-                                total_cost = 0.0
-                                for u in usage_list:
-                                    if isinstance(u, dict):
-                                        c = u.get("cost")
-                                        pt = u.get("prompt_tokens", 0) or 0
-                                        ct = u.get("completion_tokens", 0) or 0
-                                        if c is not None:
-                                            try:
-                                                cost_val = float(c)
-                                                total_cost += cost_val
-                                                cost_str = f", cost={cost_val} credits"
-                                            except (TypeError, ValueError):
-                                                logger.debug(
-                                                    "Malformed cost value in stream: %r",
-                                                    c,
-                                                )
-                                                cost_str = ""
-                                        else:
-                                            est = (
-                                                estimate_cost_for_log(pt, ct)
-                                                if (pt or ct)
-                                                else 0.0
-                                            )
-                                            cost_str = (
-                                                f", cost≈{est} credits (estimated)"
-                                                if (pt or ct)
-                                                else ""
-                                            )
-                                        logger.info(
-                                            "[OpenRouter usage] model=%s prompt_tokens=%s completion_tokens=%s total_tokens=%s%s"
-                                            % (
-                                                u.get("model", ""),
-                                                pt,
-                                                ct,
-                                                u.get("total_tokens", 0),
-                                                cost_str,
-                                            )
-                                        )
-                                if usage_list:
-                                    logger.info(
-                                        "[LLM cost this run] total=%s credits (see lines above for per-call breakdown)"
-                                        % (total_cost,)
-                                    )
-                            else:
-                                logger.info(
-                                    "[LLM cost] no usage data in stream — cost is logged in the Celery worker; "
-                                    "run worker with -Q staging_agent_tasks to see it (e.g. ./scripts/run_celery_worker.sh)"
-                                )
-                            yield event
-                            return
-
-                        yield event
-
-        except Exception as e:
-            logger.error(f"Error consuming Redis stream {key}: {str(e)}")
-            yield {
-                "type": "end",
-                "status": "error",
-                "message": f"Stream error: {str(e)}",
-                "stream_id": cursor or "0-0",
-            }
-
     def _format_event(self, event_id, event_data: dict) -> dict:
         """Format Redis stream event for client consumption"""
         # Ensure event_id is string
@@ -245,7 +180,7 @@ class RedisStreamManager:
 
             if key_str.endswith("_json"):
                 try:
-                    parsed_value = json.loads(value_str)
+                    parsed_value = _loads_json(value_str)
                     formatted_key = key_str.replace("_json", "")
                     if formatted_key == "tool_calls":
                         pass  # No special handling needed for tool_calls
@@ -476,7 +411,7 @@ def _format_stream_event(event_id, event_data: dict) -> dict:
         value_str = v.decode() if isinstance(v, bytes) else v
         if key_str.endswith("_json"):
             try:
-                parsed_value = json.loads(value_str)
+                parsed_value = _loads_json(value_str)
                 formatted[key_str.replace("_json", "")] = parsed_value
             except Exception as e:
                 logger.error(
@@ -498,9 +433,13 @@ class AsyncRedisStreamManager:
         if AsyncRedis is None:
             raise RuntimeError("redis.asyncio not available; install redis>=4.2")
         config = ConfigProvider()
+        # Same timeouts as the sync client so a dead connection cannot hang a
+        # stream consumer; socket_timeout must exceed the 5s XREAD block.
         self.redis_client: AsyncRedis = AsyncRedis.from_url(
             config.get_redis_url(),
             max_connections=max_connections,
+            socket_connect_timeout=10,
+            socket_timeout=30,
         )
         self.stream_ttl = ConfigProvider.get_stream_ttl_secs()
         self.max_len = ConfigProvider.get_stream_maxlen()
@@ -555,27 +494,12 @@ class AsyncRedisStreamManager:
     ) -> None:
         key = self.stream_key(conversation_id, run_id)
 
-        def serialize_value(v):
-            if isinstance(v, bytes):
-                return v.decode("utf-8", errors="replace")
-            elif isinstance(v, (dict, list)):
-                return json.dumps(
-                    v,
-                    default=lambda x: (
-                        x.decode("utf-8", errors="replace")
-                        if isinstance(x, bytes)
-                        else str(x)
-                    ),
-                )
-            else:
-                return str(v)
-
         event_data = {
             "type": event_type,
             "conversation_id": conversation_id,
             "run_id": run_id,
             "created_at": datetime.utcnow().isoformat(),
-            **{k: serialize_value(v) for k, v in payload.items()},
+            **{k: _serialize_stream_value(v) for k, v in payload.items()},
         }
         try:
             # XADD with auto-generated ID must not be retried: each retry would append a
@@ -587,7 +511,9 @@ class AsyncRedisStreamManager:
                 lambda: self.redis_client.expire(key, self.stream_ttl)
             )
             logger.debug(
-                f"Published {event_type} event to stream {key}",
+                "Published %s event to stream %s",
+                event_type,
+                key,
                 event_type=event_type,
                 key=key,
             )
@@ -705,6 +631,98 @@ class AsyncRedisStreamManager:
             await asyncio.sleep(0.5)
         return False
 
+    async def consume_stream(
+        self, conversation_id: str, run_id: str, cursor: Optional[str] = None
+    ) -> AsyncGenerator[dict, None]:
+        """Native async Redis stream consumption for HTTP streaming.
+
+        The blocking XREAD is awaited on the event loop instead of parking a
+        threadpool worker per client and hopping threads for every chunk.
+        """
+        key = self.stream_key(conversation_id, run_id)
+
+        try:
+            # Only replay existing events if cursor is explicitly provided (for reconnection)
+            events = []
+            if cursor:
+                events = await self.redis_client.xrange(key, min=cursor, max="+")
+                for event_id, event_data in events:
+                    yield _format_stream_event(event_id, event_data)
+
+            # Set starting point for live events
+            if cursor and events:
+                last_id = events[-1][0]
+            elif not cursor and await self.redis_client.exists(key):
+                # Fresh attach: replay from the beginning. Hatchet workers can publish
+                # start/chunk events before the HTTP consumer connects; skipping to the
+                # latest entry drops tool-call and thinking chunks emitted early.
+                existing = await self.redis_client.xrange(key, min="-", max="+")
+                for event_id, event_data in existing:
+                    formatted_event = _format_stream_event(event_id, event_data)
+                    yield formatted_event
+                    if formatted_event.get("type") == "end":
+                        return
+                last_id = existing[-1][0] if existing else "0-0"
+            else:
+                last_id = "0-0"
+
+            # If no cursor provided (fresh request), wait for stream to be created
+            if not cursor and not await self.redis_client.exists(key):
+                wait_timeout = 120  # 2 minutes, covers queued Celery tasks
+                wait_start = datetime.now()
+
+                while not await self.redis_client.exists(key):
+                    if (datetime.now() - wait_start).total_seconds() > wait_timeout:
+                        yield {
+                            "type": "end",
+                            "status": "timeout",
+                            "message": "Stream creation timeout - task may be queued",
+                            "stream_id": "0-0",
+                        }
+                        return
+                    await asyncio.sleep(0.5)
+
+            while True:
+                # Check if key still exists (TTL expiry detection)
+                if not await self.redis_client.exists(key):
+                    yield {
+                        "type": "end",
+                        "status": "expired",
+                        "message": "Stream expired",
+                        "stream_id": last_id,
+                    }
+                    return
+
+                events = await self.redis_client.xread(
+                    {key: last_id}, block=5000, count=1
+                )
+                if not events:
+                    continue
+
+                for _stream_key, stream_events in events:
+                    for event_id, event_data in stream_events:
+                        last_id = event_id
+                        event = _format_stream_event(event_id, event_data)
+
+                        if event.get("type") == "end":
+                            logger.info(
+                                f"Stream {key} ended with status: {event.get('status')}"
+                            )
+                            _log_stream_usage(event)
+                            yield event
+                            return
+
+                        yield event
+
+        except Exception as e:
+            logger.error(f"Error consuming Redis stream {key}: {str(e)}")
+            yield {
+                "type": "end",
+                "status": "error",
+                "message": f"Stream error: {str(e)}",
+                "stream_id": cursor or "0-0",
+            }
+
     async def aclose(self) -> None:
         await self.redis_client.aclose()
         logger.debug("AsyncRedisStreamManager connection closed")
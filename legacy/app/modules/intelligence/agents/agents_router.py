@@ -39,7 +39,7 @@ class AgentsAPI:
     ):
         user_id: str = user["user_id"]
         llm_provider = ProviderService(db, user_id)
-        tools_provider = ToolService(db, user_id)
+        tools_provider = ToolService(db, user_id, provider_service=llm_provider)
         prompt_provider = PromptService(db)
         controller = AgentsController(db, llm_provider, prompt_provider, tools_provider)
         return await controller.list_available_agents(user, list_system_agents)
@@ -1,6 +1,5 @@
 """Execution flows for different agent execution modes"""
 
-import os
 import traceback
 from typing import AsyncGenerator, Any, Optional
 
@@ -18,7 +17,10 @@ from app.modules.intelligence.agents.chat_agent import ChatContext, ChatAgentRes
 from app.modules.intelligence.provider.openrouter_usage_context import (
     push_usage_from_run,
 )
-from app.modules.intelligence.tracing.logfire_tracer import logfire_trace_metadata
+from app.modules.intelligence.tracing.logfire_tracer import (
+    DEFAULT_TRACE_ENVIRONMENT,
+    logfire_trace_metadata,
+)
 from observability import get_logger
 
 logger = get_logger(__name__)
@@ -122,10 +124,8 @@ def _build_run_metadata(ctx: ChatContext) -> dict[str, Any]:
     if getattr(ctx, "conversation_id", None):
         meta["conversation_id"] = ctx.conversation_id  # type: ignore[assignment]
 
-    # Also include environment if available so it is easy to query
-    env = os.getenv("LOGFIRE_ENVIRONMENT") or os.getenv("ENV")
-    if env:
-        meta["environment"] = env
+    # Also include environment so it is easy to query
+    meta["environment"] = DEFAULT_TRACE_ENVIRONMENT
 
     # Drop None values
     return {k: v for k, v in meta.items() if v is not None}
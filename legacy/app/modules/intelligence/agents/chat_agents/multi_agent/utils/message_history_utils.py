@@ -23,7 +23,7 @@ logger = get_logger(__name__)
 
 
 def _history_strings_to_model_messages(
-    history_list: List[str],
+    history_list: List[Any],
 ) -> List[ModelMessage]:
     """Convert history strings (e.g. 'human: ...' / 'ai: ...') to proper ModelMessage list.
 
@@ -36,17 +36,22 @@ def _history_strings_to_model_messages(
     """
     result: List[ModelMessage] = []
     for raw in history_list:
-        s = str(raw).strip()
+        # Entries that are already model messages need no parsing.
+        if isinstance(raw, (ModelRequest, ModelResponse)):
+            result.append(raw)
+            continue
+        s = (raw if isinstance(raw, str) else str(raw)).strip()
         if not s:
             continue
         # Support "human: ...", "HUMAN: ...", "ai: ...", "AI_GENERATED: ..."
-        lower = s.lower()
-        if lower.startswith("human:"):
+        # Only the role prefix needs case folding, not the whole message.
+        prefix = s[:13].lower()  # len("ai_generated:") = 13
+        if prefix.startswith("human:"):
             content = s[6:].strip()  # len("human:") = 6
             if content:
                 result.append(ModelRequest(parts=[UserPromptPart(content=content)]))
-        elif lower.startswith("ai_generated:") or lower.startswith("ai:"):
-            prefix_len = 12 if lower.startswith("ai_generated:") else 3
+        elif prefix.startswith("ai_generated:") or prefix.startswith("ai:"):
+            prefix_len = 13 if prefix.startswith("ai_generated:") else 3
             content = s[prefix_len:].strip()
             if content:
                 result.append(ModelResponse(parts=[TextPart(content=content)]))
@@ -82,7 +82,7 @@ class ToolCallStreamManager:
 
         try:
             self._sync_publish_stream_part(key, event_data)
-            logger.debug(f"Published stream part to tool call stream {key}", key=key)
+            logger.debug("Published stream part to tool call stream %s", key, key=key)
         except Exception:
             raise
 
@@ -136,7 +136,7 @@ class ToolCallStreamManager:
                 partial(self._sync_publish_stream_part, key, event_data),
             )
             logger.debug(
-                f"Published stream part to tool call stream {key} (async)", key=key
+                "Published stream part to tool call stream %s (async)", key, key=key
             )
         except Exception as e:
             logger.error(
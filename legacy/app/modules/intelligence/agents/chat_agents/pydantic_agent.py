@@ -1,5 +1,6 @@
 import functools
 import inspect
+import logging
 import re
 from typing import List, AsyncGenerator, Sequence
 
@@ -96,6 +97,66 @@ def handle_exception(tool_func):
     return wrapper
 
 
+@functools.lru_cache(maxsize=128)
+def _static_instructions_prefix(role: str, goal: str, backstory: str) -> str:
+    """Render the per-agent static part of the instructions once.
+
+    Guidelines and identity only depend on the agent config, so the rendered
+    text is shared by every turn (and stays byte-identical ahead of the cache
+    breakpoint for provider-side prompt caching).
+    """
+    return f"""
+# Agent Execution Guidelines
+
+You are an AI assistant that helps users with code analysis and tasks. Follow these principles:
+
+1. **Be thorough**: Analyze code carefully before making recommendations
+2. **Use tools effectively**: Leverage available tools to gather information
+3. **Provide clear explanations**: Explain your reasoning and findings
+4. **Handle errors gracefully**: If a tool fails, try alternative approaches
+
+## Tool Usage Best Practices
+
+- Use available tools to gather information before generating responses
+- Use `fetch_file` with `with_line_numbers=true` for precise code references
+- Use `ask_knowledge_graph_queries` for semantic code search
+- Use `get_code_file_structure` to understand project layout
+- Verify your findings before presenting conclusions
+
+## Output Guidelines
+
+- Structure responses with clear headings
+- Include relevant code snippets with file paths
+- Summarize key findings at the end
+
+<!-- CACHE_BREAKPOINT -->
+
+Your Identity:
+Role: {role}
+Goal: {goal}
+Backstory:
+{backstory}
+
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _disable_parallel_tools_kwarg() -> tuple[str, bool | int] | None:
+    """Resolve which Agent kwarg (if any) disables parallel tool calls.
+
+    The pydantic-ai Agent signature does not change at runtime, so inspect it
+    once per process instead of on every agent construction.
+    """
+    signature = inspect.signature(Agent.__init__)
+    if "allow_parallel_tool_calls" in signature.parameters:
+        return ("allow_parallel_tool_calls", False)
+    if "max_parallel_tool_calls" in signature.parameters:
+        return ("max_parallel_tool_calls", 1)
+    if "tool_parallelism" in signature.parameters:
+        return ("tool_parallelism", False)
+    return None
+
+
 class PydanticRagAgent(ChatAgent):
     def __init__(
         self,
@@ -169,39 +230,7 @@ class PydanticRagAgent(ChatAgent):
             "model": self.llm_provider.get_pydantic_model(),
             "tools": wrapped_tools,
             "mcp_servers": mcp_toolsets,
-            "instructions": f"""
-# Agent Execution Guidelines
-
-You are an AI assistant that helps users with code analysis and tasks. Follow these principles:
-
-1. **Be thorough**: Analyze code carefully before making recommendations
-2. **Use tools effectively**: Leverage available tools to gather information
-3. **Provide clear explanations**: Explain your reasoning and findings
-4. **Handle errors gracefully**: If a tool fails, try alternative approaches
-
-## Tool Usage Best Practices
-
-- Use available tools to gather information before generating responses
-- Use `fetch_file` with `with_line_numbers=true` for precise code references
-- Use `ask_knowledge_graph_queries` for semantic code search
-- Use `get_code_file_structure` to understand project layout
-- Verify your findings before presenting conclusions
-
-## Output Guidelines
-
-- Structure responses with clear headings
-- Include relevant code snippets with file paths
-- Summarize key findings at the end
-
-<!-- CACHE_BREAKPOINT -->
-
-Your Identity:
-Role: {config.role}
-Goal: {config.goal}
-Backstory:
-{config.backstory}
-
-{multimodal_instructions}
+            "instructions": f"""{_static_instructions_prefix(config.role, config.goal, config.backstory)}{multimodal_instructions}
 
 CURRENT CONTEXT AND AGENT TASK OVERVIEW:
 {self._create_task_description(task_config=config.tasks[0], ctx=ctx)}
@@ -217,13 +246,9 @@ CURRENT CONTEXT AND AGENT TASK OVERVIEW:
 
         if not allow_parallel_tools:
             try:
-                signature = inspect.signature(Agent.__init__)
-                if "allow_parallel_tool_calls" in signature.parameters:
-                    agent_kwargs["allow_parallel_tool_calls"] = False
-                elif "max_parallel_tool_calls" in signature.parameters:
-                    agent_kwargs["max_parallel_tool_calls"] = 1
-                elif "tool_parallelism" in signature.parameters:
-                    agent_kwargs["tool_parallelism"] = False
+                parallel_kwarg = _disable_parallel_tools_kwarg()
+                if parallel_kwarg is not None:
+                    agent_kwargs[parallel_kwarg[0]] = parallel_kwarg[1]
                 else:
                     logger.info(
                         "Parallel tool call disabling not supported by current pydantic-ai Agent signature."
@@ -385,6 +410,8 @@ CURRENT CONTEXT AND AGENT TASK OVERVIEW:
 
     def _debug_multimodal_content(self, ctx: ChatContext) -> None:
         """Debug method to log detailed information about multimodal content"""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         logger.debug(f"Context has images: {ctx.has_images()}")
         logger.debug(f"Context has documents: {ctx.has_documents()}")
 
@@ -892,6 +919,10 @@ CURRENT CONTEXT AND AGENT TASK OVERVIEW:
 
         # Create agent directly
         agent = self._create_agent(ctx)
+        # Built once and shared by the MCP attempt and the no-MCP fallback.
+        message_history = [
+            ModelResponse([TextPart(content=msg)]) for msg in ctx.history
+        ]
 
         try:
             # Try to initialize MCP servers with timeout handling
@@ -899,10 +930,7 @@ CURRENT CONTEXT AND AGENT TASK OVERVIEW:
                 async with agent.run_mcp_servers():
                     async with agent.iter(
                         user_prompt=ctx.query,
-                        message_history=[
-                            ModelResponse([TextPart(content=msg)])
-                            for msg in ctx.history
-                        ],
+                        message_history=message_history,
                     ) as run:
                         async for node in run:
                             if Agent.is_model_request_node(node):
@@ -1083,10 +1111,7 @@ CURRENT CONTEXT AND AGENT TASK OVERVIEW:
                 try:
                     async with agent.iter(
                         user_prompt=ctx.query,
-                        message_history=[
-                            ModelResponse([TextPart(content=msg)])
-                            for msg in ctx.history
-                        ],
+                        message_history=message_history,
                     ) as run:
                         async for node in run:
                             if Agent.is_model_request_node(node):
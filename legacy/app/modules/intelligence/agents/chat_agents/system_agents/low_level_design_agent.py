@@ -1,3 +1,5 @@
+import asyncio
+
 from app.modules.intelligence.agents.chat_agents.agent_config import (
     AgentConfig,
     TaskConfig,
@@ -133,19 +135,24 @@ class LowLevelDesignAgent(ChatAgent):
             return PydanticRagAgent(self.llm_provider, agent_config, tools)
 
     async def _enriched_context(self, ctx: ChatContext) -> ChatContext:
-        if ctx.node_ids and len(ctx.node_ids) > 0:
-            code_results = await self.tools_provider.get_code_from_multiple_node_ids_tool.run_multiple(
-                ctx.project_id, ctx.node_ids
-            )
+        fetch_code = bool(ctx.node_ids)
+        code_results, file_structure = await asyncio.gather(
+            (
+                self.tools_provider.get_code_from_multiple_node_ids_tool.run_multiple(
+                    ctx.project_id, ctx.node_ids
+                )
+                if fetch_code
+                else asyncio.sleep(0)
+            ),
+            self.tools_provider.file_structure_tool.fetch_repo_structure(
+                ctx.project_id
+            ),
+        )
+        if fetch_code:
             ctx.additional_context += (
                 f"Code Graph context of the node_ids in query:\n {code_results}"
             )
 
-        file_structure = (
-            await self.tools_provider.file_structure_tool.fetch_repo_structure(
-                ctx.project_id
-            )
-        )
         ctx.additional_context += f"File Structure of the project:\n {file_structure}"
 
         return ctx
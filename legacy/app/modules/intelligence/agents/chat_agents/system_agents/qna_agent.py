@@ -1,3 +1,4 @@
+import asyncio
 from typing import AsyncGenerator, Optional
 
 from app.modules.intelligence.agents.chat_agents.agent_config import (
@@ -224,20 +225,32 @@ class QnAAgent(ChatAgent):
         return await self._append_code_and_structure(ctx)
 
     async def _append_code_and_structure(self, ctx: ChatContext) -> ChatContext:
-        if ctx.node_ids and len(ctx.node_ids) > 0:
-            code_results = await self.tools_provider.get_code_from_multiple_node_ids_tool.run_multiple(
-                ctx.project_id, ctx.node_ids
-            )
+        # Node code and repo structure are independent lookups; fetch them together.
+        fetch_code = bool(ctx.node_ids)
+        fetch_structure = FILE_STRUCTURE_CONTEXT_MARKER not in ctx.additional_context
+        code_results, file_structure = await asyncio.gather(
+            (
+                self.tools_provider.get_code_from_multiple_node_ids_tool.run_multiple(
+                    ctx.project_id, ctx.node_ids
+                )
+                if fetch_code
+                else asyncio.sleep(0)
+            ),
+            (
+                self.tools_provider.file_structure_tool.fetch_repo_structure(
+                    ctx.project_id
+                )
+                if fetch_structure
+                else asyncio.sleep(0)
+            ),
+        )
+
+        if fetch_code:
             ctx.additional_context += (
                 f"Code context of the node_ids in query:\n {code_results}"
             )
 
-        if FILE_STRUCTURE_CONTEXT_MARKER not in ctx.additional_context:
-            file_structure = (
-                await self.tools_provider.file_structure_tool.fetch_repo_structure(
-                    ctx.project_id
-                )
-            )
+        if fetch_structure:
             ctx.additional_context += (
                 f"\n{FILE_STRUCTURE_CONTEXT_MARKER}\n"
                 f"{FILE_STRUCTURE_HEADER} {file_structure}"
@@ -25,7 +25,7 @@ class CustomAgentController:
     def __init__(self, user_id: str, db: Session = Depends(get_db)):
         self.db = db
         provider_service = ProviderService(db, user_id)
-        tool_service = ToolService(db, user_id)
+        tool_service = ToolService(db, user_id, provider_service=provider_service)
         self.service = CustomAgentService(db, provider_service, tool_service)
         self.user_service = UserService(db)
 
@@ -22,6 +22,35 @@ class ChatHistoryServiceError(Exception):
     """Base exception class for ChatHistoryService errors."""
 
 
+def _new_message_buffer() -> Dict[str, Any]:
+    # Content and thinking are kept as lists of parts and joined once on
+    # flush; appending to a str per streamed chunk is quadratic in the
+    # response length.
+    return {
+        "content": [],
+        "citations": [],
+        "tool_calls": [],
+        "thinking": [],
+    }
+
+
+def _buffer_chunk(
+    buffer: Dict[str, Any],
+    content: str,
+    citations: Optional[List[str]],
+    tool_calls: Optional[List[Dict[str, Any]]],
+    thinking: Optional[str],
+) -> None:
+    if content:
+        buffer["content"].append(content)
+    if citations:
+        buffer["citations"].extend(citations)
+    if tool_calls:
+        buffer["tool_calls"].extend(tool_calls)
+    if thinking:
+        buffer["thinking"].append(thinking)
+
+
 class ChatHistoryService:
     def __init__(self, db: Session):
         self.db = db
@@ -68,23 +97,10 @@ class ChatHistoryService:
         tool_calls: Optional[List[Dict[str, Any]]] = None,
         thinking: Optional[str] = None,
     ):
-        if conversation_id not in self.message_buffer:
-            self.message_buffer[conversation_id] = {
-                "content": "",
-                "citations": [],
-                "tool_calls": [],
-                "thinking": None,
-            }
-        self.message_buffer[conversation_id]["content"] += content
-        if citations:
-            self.message_buffer[conversation_id]["citations"].extend(citations)
-        if tool_calls:
-            self.message_buffer[conversation_id]["tool_calls"].extend(tool_calls)
-        if thinking:
-            if self.message_buffer[conversation_id]["thinking"] is None:
-                self.message_buffer[conversation_id]["thinking"] = thinking
-            else:
-                self.message_buffer[conversation_id]["thinking"] += thinking
+        buffer = self.message_buffer.get(conversation_id)
+        if buffer is None:
+            buffer = self.message_buffer[conversation_id] = _new_message_buffer()
+        _buffer_chunk(buffer, content, citations, tool_calls, thinking)
 
     def flush_message_buffer(
         self,
@@ -94,17 +110,12 @@ class ChatHistoryService:
         thinking: Optional[str] = None,
     ) -> Optional[str]:
         try:
-            if (
-                conversation_id in self.message_buffer
-                and self.message_buffer[conversation_id]["content"]
-            ):
-                content = self.message_buffer[conversation_id]["content"]
-                citations = self.message_buffer[conversation_id]["citations"]
-                tool_calls = self.message_buffer[conversation_id].get("tool_calls", [])
+            buffer = self.message_buffer.get(conversation_id)
+            if buffer and buffer["content"]:
+                content = "".join(buffer["content"])
+                citations = buffer["citations"]
                 # Use provided thinking if given, otherwise fall back to buffer
-                thinking = thinking or self.message_buffer[conversation_id].get(
-                    "thinking"
-                )
+                thinking = thinking or ("".join(buffer["thinking"]) or None)
 
                 new_message = Message(
                     id=str(uuid7()),
@@ -121,12 +132,7 @@ class ChatHistoryService:
                 )
                 self.db.add(new_message)
                 self.db.commit()
-                self.message_buffer[conversation_id] = {
-                    "content": "",
-                    "citations": [],
-                    "tool_calls": [],
-                    "thinking": None,
-                }
+                self.message_buffer[conversation_id] = _new_message_buffer()
                 logger.info(
                     f"Flushed message buffer for conversation: {conversation_id}",
                     conversation_id=conversation_id,
@@ -296,27 +302,10 @@ class AsyncChatHistoryService:
         thinking: Optional[str] = None,
     ) -> None:
         """Buffer a chunk (in-memory only; no DB)."""
-        if conversation_id not in self.message_buffer:
-            self.message_buffer[conversation_id] = {
-                "content": "",
-                "citations": [],
-                "tool_calls": [],
-                "thinking": None,
-            }
-        self.message_buffer[conversation_id]["content"] += content
-        if citations:
-            self.message_buffer[conversation_id]["citations"].extend(citations)
-        if tool_calls:
-            self.message_buffer[conversation_id]["tool_calls"].extend(tool_calls)
-        if thinking:
-            if self.message_buffer[conversation_id]["thinking"] is None:
-                self.message_buffer[conversation_id]["thinking"] = thinking
-            else:
-                self.message_buffer[conversation_id]["thinking"] += thinking
-        logger.debug(
-            "Added message chunk to buffer for conversation: %s",
-            conversation_id,
-        )
+        buffer = self.message_buffer.get(conversation_id)
+        if buffer is None:
+            buffer = self.message_buffer[conversation_id] = _new_message_buffer()
+        _buffer_chunk(buffer, content, citations, tool_calls, thinking)
 
     async def flush_message_buffer(
         self,
@@ -325,14 +314,11 @@ class AsyncChatHistoryService:
         sender_id: Optional[str] = None,
     ) -> Optional[str]:
         try:
-            if (
-                conversation_id in self.message_buffer
-                and self.message_buffer[conversation_id]["content"]
-            ):
-                content = self.message_buffer[conversation_id]["content"]
-                citations = self.message_buffer[conversation_id]["citations"]
-                tool_calls = self.message_buffer[conversation_id].get("tool_calls", [])
-                thinking = self.message_buffer[conversation_id].get("thinking")
+            buffer = self.message_buffer.get(conversation_id)
+            if buffer and buffer["content"]:
+                content = "".join(buffer["content"])
+                citations = buffer["citations"]
+                thinking = "".join(buffer["thinking"]) or None
 
                 new_message = Message(
                     id=str(uuid7()),
@@ -347,12 +333,7 @@ class AsyncChatHistoryService:
                 )
                 self.session.add(new_message)
                 await self.session.commit()
-                self.message_buffer[conversation_id] = {
-                    "content": "",
-                    "citations": [],
-                    "tool_calls": [],
-                    "thinking": None,
-                }
+                self.message_buffer[conversation_id] = _new_message_buffer()
                 logger.info(
                     "Flushed message buffer for conversation: %s",
                     conversation_id,
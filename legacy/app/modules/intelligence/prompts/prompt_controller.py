@@ -121,7 +121,7 @@ class PromptController:
 
         llm_provider = ProviderService(db, user["user_id"])
         prompt_provider = PromptService(db)
-        tools_provider = ToolService(db, user["user_id"])
+        tools_provider = ToolService(db, user["user_id"], provider_service=llm_provider)
 
         agents_service = AgentsService(
             db, llm_provider, prompt_provider, tools_provider
@@ -142,13 +142,19 @@ class PromptController:
         )
 
         if not is_custom_agent:
-            enhanced_prompt = await PromptService(db).enhance_prompt(
-                request_body.prompt, last_messages, user, agent_ids, available_agents
+            enhanced_prompt = await prompt_provider.enhance_prompt(
+                request_body.prompt,
+                last_messages,
+                user,
+                agent_ids,
+                available_agents,
+                provider_service=llm_provider,
             )
         else:
-            enhanced_prompt = await PromptService(db).enhance_prompt(
+            enhanced_prompt = await prompt_provider.enhance_prompt(
                 request_body.prompt,
                 last_messages,
                 user,
+                provider_service=llm_provider,
             )
         return enhanced_prompt
@@ -1,5 +1,6 @@
+import hashlib
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
@@ -23,10 +24,54 @@ from app.modules.intelligence.prompts.prompt_schema import (
 from app.modules.conversations.message.message_schema import MessageResponse
 from app.modules.intelligence.prompts.prompt_schema import EnhancedPromptResponse
 from app.modules.intelligence.provider.provider_service import ProviderService
+from app.modules.utils.ttl_cache import TTLCache
 from observability import get_logger
 
 logger = get_logger(__name__)
 
+# Enhancement (which also picks the expertise domain from the available
+# agents) is one LLM round trip per request. Repeating the same query on the
+# same conversation tail yields the same result, so short-circuit exact
+# repeats from a small bounded cache.
+ENHANCED_PROMPT_CACHE_TTL_SECONDS = 600
+ENHANCED_PROMPT_CACHE_MAX_ENTRIES = 4096
+ENHANCED_PROMPT_HISTORY_WINDOW = 5
+
+_enhanced_prompt_cache: TTLCache[str] = TTLCache(
+    ENHANCED_PROMPT_CACHE_TTL_SECONDS, ENHANCED_PROMPT_CACHE_MAX_ENTRIES
+)
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _enhanced_prompt_cache_key(
+    user_id: str,
+    prompt: str,
+    last_messages: List[MessageResponse],
+    agent_ids,
+    available_agents,
+) -> Tuple[str, ...]:
+    # Whitespace-only normalization: the rewrite echoes identifiers and paths,
+    # so queries differing in case must not share a cached result.
+    normalized_query = " ".join(prompt.split())
+    history = "|".join(
+        msg.content or "" for msg in last_messages[-ENHANCED_PROMPT_HISTORY_WINDOW:]
+    )
+    return (
+        str(user_id),
+        ",".join(agent_ids or []),
+        _digest(str(available_agents)) if available_agents else "",
+        _digest(normalized_query),
+        _digest(history),
+    )
+
+
+def reset_enhanced_prompt_cache() -> None:
+    """Clear the enhanced prompt cache (for tests)."""
+    _enhanced_prompt_cache.clear()
+
 
 class PromptServiceError(Exception):
     """Base exception class for PromptService errors."""
@@ -345,8 +390,22 @@ class PromptService:
         user: dict,
         agent_ids=None,
         available_agents=None,
+        provider_service: Optional[ProviderService] = None,
     ) -> str:
-        if agent_ids and available_agents:
+        use_classification = bool(agent_ids and available_agents)
+        cache_key = _enhanced_prompt_cache_key(
+            user["user_id"],
+            prompt,
+            last_messages,
+            agent_ids if use_classification else None,
+            available_agents if use_classification else None,
+        )
+        cached = _enhanced_prompt_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Enhanced prompt cache hit", user_id=user["user_id"])
+            return cached
+
+        if use_classification:
             inputs = {
                 "query": prompt,
                 "history": [msg.content for msg in last_messages],
@@ -380,15 +439,20 @@ class PromptService:
             ]
 
         try:
-            provider_service = ProviderService(self.db, user["user_id"])
+            provider_service = provider_service or ProviderService(
+                self.db, user["user_id"]
+            )
             result = await provider_service.call_llm_with_structured_output(
                 messages=messages,
                 output_schema=EnhancedPromptResponse,  # type: ignore
                 config_type="chat",
             )
-            return result.enhancedprompt
+            enhanced = result.enhancedprompt
         except Exception:
             raise
+        if enhanced:
+            _enhanced_prompt_cache.set(cache_key, enhanced)
+        return enhanced
 
 
 def get_prompt(prompt_key: str) -> str:
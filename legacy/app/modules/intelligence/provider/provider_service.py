@@ -12,6 +12,7 @@ from app.modules.users.user_preferences_model import UserPreferences
 from app.modules.utils.posthog_helper import PostHogClient
 from observability import get_logger
 from app.modules.intelligence.tracing.logfire_tracer import (
+    DEFAULT_TRACE_ENVIRONMENT,
     logfire_llm_call_metadata,
 )
 
@@ -48,7 +49,7 @@ from app.modules.intelligence.provider.anthropic_caching_model import (
 import random
 import time
 import asyncio
-from functools import wraps
+from functools import lru_cache, wraps
 
 logger = get_logger(__name__)
 
@@ -294,6 +295,16 @@ def _log_openrouter_usage(model_id: str, response: Any) -> None:
     print(msg, flush=True)
 
 
+@lru_cache(maxsize=1)
+def _litellm_json_instructor_client() -> Any:
+    """Shared instructor client over litellm's acompletion (JSON mode).
+
+    The client holds no per-request state (model, keys and base_url are passed
+    on each create call), so patching acompletion once per process is enough.
+    """
+    return instructor.from_litellm(acompletion, mode=instructor.Mode.JSON)
+
+
 def sanitize_messages_for_tracing(messages: list) -> list:
     """
     Sanitize messages to prevent OpenTelemetry encoding errors.
@@ -864,7 +875,7 @@ class ProviderService:
         routing_provider = config.provider
 
         # Environment for span attributes
-        env = (os.getenv("LOGFIRE_ENVIRONMENT") or os.getenv("ENV") or "local").strip()
+        env = DEFAULT_TRACE_ENVIRONMENT
 
         try:
             if output_schema:
@@ -905,9 +916,7 @@ class ProviderService:
                         **ollama_request_kwargs,
                     )
                 else:
-                    client = instructor.from_litellm(
-                        acompletion, mode=instructor.Mode.JSON
-                    )
+                    client = _litellm_json_instructor_client()
                     response = await client.chat.completions.create(
                         model=params["model"],
                         messages=messages,
@@ -968,7 +977,7 @@ class ProviderService:
         routing_provider = config.provider
 
         # Environment for span attributes
-        env = (os.getenv("LOGFIRE_ENVIRONMENT") or os.getenv("ENV") or "local").strip()
+        env = DEFAULT_TRACE_ENVIRONMENT
 
         # Handle streaming response if requested. We wrap the actual LiteLLM call
         # in a Logfire span so we always get an app-owned span with user_id/env.
@@ -1024,7 +1033,7 @@ class ProviderService:
         }
 
         # Environment for span attributes
-        env = (os.getenv("LOGFIRE_ENVIRONMENT") or os.getenv("ENV") or "local").strip()
+        env = DEFAULT_TRACE_ENVIRONMENT
 
         try:
             with logfire_llm_call_metadata(
@@ -1061,9 +1070,7 @@ class ProviderService:
                         **ollama_request_kwargs,
                     )
                 else:
-                    client = instructor.from_litellm(
-                        acompletion, mode=instructor.Mode.JSON
-                    )
+                    client = _litellm_json_instructor_client()
                     (
                         parsed_response,
                         completion,
@@ -1111,7 +1118,7 @@ class ProviderService:
         routing_provider = config.provider
 
         # Environment for span attributes
-        env = (os.getenv("LOGFIRE_ENVIRONMENT") or os.getenv("ENV") or "local").strip()
+        env = DEFAULT_TRACE_ENVIRONMENT
 
         # Validate and filter images before processing
         if images:
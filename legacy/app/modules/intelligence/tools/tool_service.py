@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -126,7 +126,12 @@ class ToolService:
         "get_nodes_from_tags",  # Uses AI-generated tags which may not exist yet
     }
 
-    def __init__(self, db: Session, user_id: str):
+    def __init__(
+        self,
+        db: Session,
+        user_id: str,
+        provider_service: Optional[ProviderService] = None,
+    ):
         self.db = db
         self.user_id = user_id
         self.webpage_extractor_tool = webpage_extractor_tool(db, user_id)
@@ -149,7 +154,9 @@ class ToolService:
         )
         self.get_code_graph_from_node_id_tool = GetCodeGraphFromNodeIdTool(db)
         self.file_structure_tool = GetCodeFileStructureTool(db)
-        self.provider_service = ProviderService.create(db, user_id)
+        # Reuse the caller's ProviderService when it has one: building a new
+        # one re-reads the user's preferences from the DB on every request.
+        self.provider_service = provider_service or ProviderService.create(db, user_id)
         self.tools = self._initialize_tools()
 
     def get_tools(
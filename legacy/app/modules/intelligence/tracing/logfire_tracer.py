@@ -52,6 +52,18 @@ from observability import get_logger
 # Max length for baggage/attribute values (Logfire truncates longer strings)
 _LOGFIRE_ATTR_MAX_LEN = 1000
 
+# Resolved once, when this module is first imported, instead of on every LLM
+# call. app.main and the Celery app run load_dotenv() before importing it; an
+# entrypoint that imports it earlier sees the environment as it was then.
+DEFAULT_TRACE_ENVIRONMENT = (
+    os.getenv("LOGFIRE_ENVIRONMENT") or os.getenv("ENV") or "local"
+).strip()
+_INSTRUMENT_PYDANTIC_AI = os.getenv("LOGFIRE_ENABLED", "true").lower() not in (
+    "false",
+    "0",
+    "no",
+)
+
 logger = get_logger(__name__)
 
 
@@ -207,8 +219,7 @@ def should_instrument_pydantic_ai() -> bool:
     This must stay enabled globally so that Pydantic AI emits agent_run spans
     for analytics. Use LOGFIRE_ENABLED=false to disable tracing entirely.
     """
-    enabled = os.getenv("LOGFIRE_ENABLED", "true").lower()
-    return enabled not in ("false", "0", "no")
+    return _INSTRUMENT_PYDANTIC_AI
 
 
 @contextmanager
@@ -301,9 +312,7 @@ def logfire_llm_call_metadata(
     attrs: Dict[str, str] = {}
     if user_id is not None:
         attrs["user_id"] = str(user_id).strip()[:_LOGFIRE_ATTR_MAX_LEN]
-    env = (
-        environment or os.getenv("LOGFIRE_ENVIRONMENT") or os.getenv("ENV") or "local"
-    ).strip()
+    env = (environment or DEFAULT_TRACE_ENVIRONMENT).strip()
     attrs["environment"] = env[:_LOGFIRE_ATTR_MAX_LEN]
     for k, v in extra_attrs.items():
         if v is None:
@@ -317,24 +326,32 @@ def logfire_llm_call_metadata(
         yield
         return
 
+    span_attrs = {"environment": attrs["environment"]}
+    if attrs.get("user_id"):
+        span_attrs["user_id"] = attrs["user_id"]
+    for k, v in attrs.items():
+        if k not in ("user_id", "environment") and v:
+            span_attrs[k] = v
+
+    # Only the telemetry setup is best-effort. The span must stay open for the
+    # whole LLM call and close after it; exceptions raised by the call itself
+    # have to propagate unchanged (yielding again from an except block would
+    # mask them with "generator didn't stop after throw()").
     try:
         import logfire
 
-        with logfire.set_baggage(**attrs):
-            span_attrs = {"environment": attrs["environment"]}
-            if attrs.get("user_id"):
-                span_attrs["user_id"] = attrs["user_id"]
-            for k, v in attrs.items():
-                if k not in ("user_id", "environment") and v:
-                    span_attrs[k] = v
-            with logfire.span("llm_call", **span_attrs):
-                yield
+        baggage_cm = logfire.set_baggage(**attrs)
+        span_cm = logfire.span("llm_call", **span_attrs)
     except Exception as e:
         logger.debug(
             "Logfire LLM metadata failed (non-fatal)",
             error=str(e),
         )
         yield
+        return
+
+    with baggage_cm, span_cm:
+        yield
 
 
 def shutdown_logfire_tracing():
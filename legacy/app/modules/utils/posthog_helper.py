@@ -1,5 +1,7 @@
 import asyncio
 import os
+import threading
+from typing import Optional
 
 from posthog import Posthog
 
@@ -7,6 +9,31 @@ from observability import get_logger
 
 logger = get_logger(__name__)
 
+# One Posthog client per process. Each Posthog() starts its own consumer
+# thread and HTTP session, so building one per event (PostHogClient() is
+# instantiated at every call site) leaked threads and re-did setup on hot
+# paths like message handling.
+_posthog_client: Optional[Posthog] = None
+_posthog_lock = threading.Lock()
+
+
+def _get_posthog_client() -> Posthog:
+    global _posthog_client
+    if _posthog_client is None:
+        with _posthog_lock:
+            if _posthog_client is None:
+                _posthog_client = Posthog(
+                    os.getenv("POSTHOG_API_KEY"), host=os.getenv("POSTHOG_HOST")
+                )
+    return _posthog_client
+
+
+def reset_posthog_client() -> None:
+    """Drop the shared Posthog client (for tests)."""
+    global _posthog_client
+    with _posthog_lock:
+        _posthog_client = None
+
 
 class PostHogClient:
     def __init__(self):
@@ -14,9 +41,7 @@ class PostHogClient:
 
         # Only initialize PostHog if not in development mode
         if self.environment == "production":
-            self.api_key = os.getenv("POSTHOG_API_KEY")
-            self.posthog_host = os.getenv("POSTHOG_HOST")
-            self.posthog = Posthog(self.api_key, host=self.posthog_host)
+            self.posthog = _get_posthog_client()
         else:
             self.posthog = None
 
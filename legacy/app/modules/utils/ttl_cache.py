@@ -0,0 +1,52 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Small thread-safe in-process cache with a TTL and a size bound.
+
+    Entries are kept in write order, so the oldest entry is always first and
+    eviction is O(1). Expired entries are dropped lazily on read.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[V, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, cached_at = entry
+            if self._clock() - cached_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        now = self._clock()
+        with self._lock:
+            self._entries.pop(key, None)
+            while self._entries and len(self._entries) >= self.max_entries:
+                self._entries.popitem(last=False)
+            self._entries[key] = (value, now)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
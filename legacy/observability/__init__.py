@@ -77,6 +77,9 @@ class StructuredLogger:
         return StructuredLogger(self._logger.getChild(suffix), self._bound_fields)
 
     def _log(self, level: int, msg, *args, **kwargs) -> None:
+        # Skip context merging, redaction and rendering for filtered-out levels.
+        if not self._logger.isEnabledFor(level):
+            return
         passthrough = {key: kwargs.pop(key) for key in list(kwargs) if key in _RESERVED}
         extra = dict(passthrough.pop("extra", {}) or {})
         cfg = _state.get("config")
@@ -8,7 +8,7 @@ import httpx
 import urllib.parse
 from pathlib import Path
 from dotenv import load_dotenv
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 # --- Basic Setup ---
 load_dotenv()  # Load .env for all environment variables
@@ -65,7 +65,10 @@ from app.modules.conversations.conversation.conversation_model import (
     Conversation,
     ConversationStatus,
 )
-from app.modules.conversations.utils.redis_streaming import RedisStreamManager
+from app.modules.conversations.utils.redis_streaming import (
+    AsyncRedisStreamManager,
+    RedisStreamManager,
+)
 from app.modules.code_provider.github.github_service import GithubService
 
 
@@ -221,19 +224,15 @@ def mock_celery_tasks(monkeypatch):
 
 @pytest.fixture
 def mock_redis_stream_manager(monkeypatch):
-    """Mocks the RedisStreamManager for conversation streaming tests."""
+    """Mocks the Redis stream managers for conversation streaming tests.
+
+    Consumption goes through AsyncRedisStreamManager.consume_stream; the sync
+    RedisStreamManager is still used for run-id bookkeeping.
+    """
     mock_manager = MagicMock(spec=RedisStreamManager)
     mock_manager.wait_for_task_start.return_value = True
     mock_manager.redis_client = MagicMock()
     mock_manager.redis_client.exists.return_value = False
-    # End the stream immediately so StreamingResponse does not hang in tests.
-    mock_manager.consume_stream.return_value = iter(
-        [
-            {"type": "queued"},
-            {"type": "end"},
-        ]
-    )
-    # Patch both the source module and the module where it's imported/used.
     monkeypatch.setattr(
         "app.modules.conversations.utils.redis_streaming.RedisStreamManager",
         lambda: mock_manager,
@@ -242,6 +241,20 @@ def mock_redis_stream_manager(monkeypatch):
         "app.modules.conversations.utils.conversation_routing.RedisStreamManager",
         lambda: mock_manager,
     )
+
+    async def _consume_stream(*args, **kwargs):
+        # End the stream immediately so StreamingResponse does not hang in tests.
+        for event in ({"type": "queued"}, {"type": "end"}):
+            yield event
+
+    mock_async_manager = MagicMock(spec=AsyncRedisStreamManager)
+    mock_async_manager.consume_stream = _consume_stream
+    mock_async_manager.aclose = AsyncMock()
+    monkeypatch.setattr(
+        "app.modules.conversations.utils.conversation_routing.AsyncRedisStreamManager",
+        lambda *args, **kwargs: mock_async_manager,
+    )
+    mock_manager.async_manager = mock_async_manager
     return mock_manager
 
 
@@ -43,6 +43,29 @@ class TestBaseTask:
         out = task.run_async(simple_coro())
         assert out == 42
 
+    def test_run_async_uses_configured_loop_factory(self):
+        """run_async builds its loop with _LOOP_FACTORY (uvloop when installed)."""
+        import asyncio
+
+        from app.celery.tasks import base_task
+
+        class Task(BaseTask):
+            request = None
+
+        created = []
+
+        def factory():
+            loop = asyncio.new_event_loop()
+            created.append(loop)
+            return loop
+
+        async def simple_coro():
+            return asyncio.get_running_loop()
+
+        with patch.object(base_task, "_LOOP_FACTORY", factory):
+            loop = Task().run_async(simple_coro())
+        assert created == [loop]
+
     def test_on_success_closes_db(self):
         """on_success closes db and sets to None."""
         mock_db = MagicMock()
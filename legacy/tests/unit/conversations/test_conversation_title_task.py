@@ -0,0 +1,81 @@
+"""Unit tests for persisting the first-message title generated alongside the answer."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.modules.conversations.conversation import (
+    conversation_service as conversation_service_module,
+)
+from app.modules.conversations.conversation.conversation_service import (
+    ConversationService,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def service():
+    with patch(
+        "app.modules.intelligence.tools.sandbox.project_sandbox.get_project_sandbox",
+        return_value=MagicMock(name="ProjectSandbox"),
+    ):
+        svc = ConversationService(
+            db=MagicMock(),
+            user_id="u1",
+            user_email="u1@example.com",
+            conversation_store=MagicMock(),
+            message_store=MagicMock(),
+            project_service=MagicMock(),
+            history_manager=MagicMock(),
+            provider_service=MagicMock(),
+            tools_service=MagicMock(),
+            promt_service=MagicMock(),
+            agent_service=MagicMock(),
+            custom_agent_service=MagicMock(),
+            media_service=MagicMock(),
+            session_service=MagicMock(),
+            redis_manager=MagicMock(),
+        )
+    svc.conversation_store.update_title = AsyncMock()
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_persist_generated_title_waits_for_pending_task(service):
+    async def _title():
+        await asyncio.sleep(0.01)
+        return "Auth flow"
+
+    await service._persist_generated_title("c1", asyncio.create_task(_title()))
+
+    service.conversation_store.update_title.assert_awaited_once_with("c1", "Auth flow")
+
+
+@pytest.mark.asyncio
+async def test_persist_generated_title_gives_up_after_timeout(service, monkeypatch):
+    monkeypatch.setattr(
+        conversation_service_module, "_TITLE_TASK_TIMEOUT_SECONDS", 0.01
+    )
+    title_task = asyncio.create_task(asyncio.Event().wait())
+
+    await service._persist_generated_title("c1", title_task)
+
+    assert title_task.cancelled()
+    service.conversation_store.update_title.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_persist_generated_title_swallows_save_errors(service):
+    service.conversation_store.update_title.side_effect = RuntimeError("db down")
+
+    async def _title():
+        return "Auth flow"
+
+    await service._persist_generated_title("c1", asyncio.create_task(_title()))
+
+    service.conversation_store.update_title.assert_awaited_once()
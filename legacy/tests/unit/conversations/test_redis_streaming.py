@@ -1,5 +1,5 @@
 """Unit tests for RedisStreamManager (sync) and AsyncRedisStreamManager."""
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -55,6 +55,49 @@ class TestRedisStreamManagerPublishEvent:
         assert event_data["conversation_id"] == "c1"
         assert event_data["run_id"] == "r1"
 
+    @patch("app.modules.conversations.utils.redis_streaming.ConfigProvider")
+    @patch("app.modules.conversations.utils.redis_streaming.redis")
+    def test_publish_event_json_encodes_nested_values_as_before(
+        self, mock_redis, mock_cp
+    ):
+        import json
+        from datetime import datetime
+
+        mock_cp.return_value.get_redis_url.return_value = "redis://localhost:6379/0"
+        mock_cp.get_stream_ttl_secs.return_value = 3600
+        mock_cp.get_stream_maxlen.return_value = 1000
+        client = MagicMock()
+        mock_redis.from_url.return_value = client
+        mgr = RedisStreamManager()
+        mgr.publish_event(
+            "c1",
+            "r1",
+            "chunk",
+            {
+                "citations_json": ["a.py", b"b.py"],
+                "meta": {"at": datetime(2024, 1, 1), 1: "one"},
+            },
+        )
+        event_data = client.xadd.call_args[0][1]
+        assert json.loads(event_data["citations_json"]) == ["a.py", "b.py"]
+        assert json.loads(event_data["meta"]) == {
+            "at": "2024-01-01 00:00:00",
+            "1": "one",
+        }
+
+    def test_payload_json_round_trips_through_one_library(self):
+        from app.modules.conversations.utils import redis_streaming
+
+        payload = {"tool_calls": [{"id": 2**63 - 1, "args": {"path": "a.py"}}]}
+        encoded = redis_streaming._dumps_json(payload)
+        assert redis_streaming._loads_json(encoded) == payload
+
+        if redis_streaming.orjson is not None:
+            nan_encoded = redis_streaming._dumps_json({"score": float("nan")})
+            assert redis_streaming._loads_json(nan_encoded) == {"score": None}
+            with pytest.raises(TypeError):
+                redis_streaming._dumps_json({"id": 2**64})
+
 
 class TestRedisStreamManagerFormatEvent:
     @patch("app.modules.conversations.utils.redis_streaming.ConfigProvider")
@@ -86,37 +129,6 @@ class TestRedisStreamManagerFormatEvent:
         assert out["tool_calls"] == [{"name": "x"}]
 
 
-class TestRedisStreamManagerConsumeStream:
-    @patch("app.modules.conversations.utils.redis_streaming.ConfigProvider")
-    @patch("app.modules.conversations.utils.redis_streaming.redis")
-    def test_fresh_connect_replays_existing_stream_from_start(self, mock_redis, mock_cp):
-        """Hatchet can publish chunks before HTTP attaches; do not skip to latest."""
-        mock_cp.return_value.get_redis_url.return_value = "redis://localhost:6379/0"
-        mock_cp.get_stream_ttl_secs.return_value = 3600
-        mock_cp.get_stream_maxlen.return_value = 1000
-        client = MagicMock()
-        client.exists.return_value = True
-        client.xrange.return_value = [
-            (
-                b"1-0",
-                {
-                    b"type": b"chunk",
-                    b"content": b"early",
-                    b"tool_calls_json": b'[{"tool_name":"search"}]',
-                },
-            ),
-            (b"2-0", {b"type": b"end", b"status": b"completed"}),
-        ]
-        mock_redis.from_url.return_value = client
-        mgr = RedisStreamManager()
-        events = list(mgr.consume_stream("c1", "r1", cursor=None))
-        types = [e.get("type") for e in events]
-        assert types == ["chunk", "end"]
-        assert events[0].get("content") == "early"
-        assert events[0].get("tool_calls") == [{"tool_name": "search"}]
-        client.xrevrange.assert_not_called()
-
-
 class TestRedisStreamManagerCancellation:
     @patch("app.modules.conversations.utils.redis_streaming.ConfigProvider")
     @patch("app.modules.conversations.utils.redis_streaming.redis")
@@ -195,3 +207,72 @@ class TestAsyncRedisStreamManagerStreamKey:
         mock_async_redis.from_url.return_value = MagicMock()
         mgr = AsyncRedisStreamManager()
         assert mgr.stream_key("conv-a", "run-b") == "chat:stream:conv-a:run-b"
+
+    @patch("app.modules.conversations.utils.redis_streaming.ConfigProvider")
+    @patch("app.modules.conversations.utils.redis_streaming.AsyncRedis")
+    def test_async_client_sets_socket_timeouts(self, mock_async_redis, mock_cp):
+        mock_cp.return_value.get_redis_url.return_value = "redis://localhost:6379/0"
+        AsyncRedisStreamManager(max_connections=1)
+        kwargs = mock_async_redis.from_url.call_args.kwargs
+        assert kwargs["socket_connect_timeout"] == 10
+        # Must outlast the 5s XREAD block used by consume_stream.
+        assert kwargs["socket_timeout"] > 5
+
+
+class TestAsyncRedisStreamManagerConsumeStream:
+    @pytest.mark.asyncio
+    @patch("app.modules.conversations.utils.redis_streaming.ConfigProvider")
+    @patch("app.modules.conversations.utils.redis_streaming.AsyncRedis")
+    async def test_fresh_connect_replays_existing_stream_from_start(
+        self, mock_async_redis, mock_cp
+    ):
+        mock_cp.return_value.get_redis_url.return_value = "redis://localhost:6379/0"
+        mock_cp.get_stream_ttl_secs.return_value = 3600
+        mock_cp.get_stream_maxlen.return_value = 1000
+        client = MagicMock()
+        client.exists = AsyncMock(return_value=True)
+        client.xrange = AsyncMock(
+            return_value=[
+                (
+                    b"1-0",
+                    {
+                        b"type": b"chunk",
+                        b"content": b"early",
+                        b"tool_calls_json": b'[{"tool_name":"search"}]',
+                    },
+                ),
+                (b"2-0", {b"type": b"end", b"status": b"completed"}),
+            ]
+        )
+        client.xread = AsyncMock()
+        mock_async_redis.from_url.return_value = client
+        mgr = AsyncRedisStreamManager()
+        events = [e async for e in mgr.consume_stream("c1", "r1", cursor=None)]
+        assert [e.get("type") for e in events] == ["chunk", "end"]
+        assert events[0].get("content") == "early"
+        assert events[0].get("tool_calls") == [{"tool_name": "search"}]
+        client.xread.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("app.modules.conversations.utils.redis_streaming.ConfigProvider")
+    @patch("app.modules.conversations.utils.redis_streaming.AsyncRedis")
+    async def test_live_events_are_read_until_end(self, mock_async_redis, mock_cp):
+        mock_cp.return_value.get_redis_url.return_value = "redis://localhost:6379/0"
+        mock_cp.get_stream_ttl_secs.return_value = 3600
+        mock_cp.get_stream_maxlen.return_value = 1000
+        client = MagicMock()
+        client.exists = AsyncMock(return_value=True)
+        client.xrange = AsyncMock(return_value=[])
+        client.xread = AsyncMock(
+            side_effect=[
+                [],
+                [(b"k", [(b"1-0", {b"type": b"chunk", b"content": b"hi"})])],
+                [(b"k", [(b"2-0", {b"type": b"end", b"status": b"completed"})])],
+            ]
+        )
+        mock_async_redis.from_url.return_value = client
+        mgr = AsyncRedisStreamManager()
+        events = [e async for e in mgr.consume_stream("c1", "r1", cursor=None)]
+        assert [e.get("type") for e in events] == ["chunk", "end"]
+        assert events[0]["stream_id"] == "1-0"
+        assert client.xread.await_count == 3
@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.modules.conversations.message.message_model import MessageType
+from app.modules.intelligence.memory.chat_history_service import ChatHistoryService
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_flush_joins_buffered_chunks_into_one_message():
+    db = MagicMock()
+    service = ChatHistoryService(db)
+
+    for part in ["Hel", "", "lo", " world"]:
+        service.add_message_chunk(
+            "conv-1", part, MessageType.AI_GENERATED, citations=["a.py"]
+        )
+    service.add_message_chunk(
+        "conv-1", "", MessageType.AI_GENERATED, thinking="reasoning"
+    )
+
+    message_id = service.flush_message_buffer("conv-1", MessageType.AI_GENERATED)
+
+    assert message_id is not None
+    db.add.assert_called_once()
+    db.commit.assert_called_once()
+    stored = db.add.call_args[0][0]
+    assert stored.content == "Hello world"
+    assert stored.citations == "a.py"
+    assert stored.thinking == "reasoning"
+    assert service.flush_message_buffer("conv-1", MessageType.AI_GENERATED) is None
+
+
+def test_flush_skips_empty_buffer():
+    db = MagicMock()
+    service = ChatHistoryService(db)
+
+    service.add_message_chunk("conv-1", "", MessageType.AI_GENERATED)
+
+    assert service.flush_message_buffer("conv-1", MessageType.AI_GENERATED) is None
+    db.add.assert_not_called()
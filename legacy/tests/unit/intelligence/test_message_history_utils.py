@@ -0,0 +1,37 @@
+import pytest
+from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
+
+from app.modules.intelligence.agents.chat_agents.multi_agent.utils.message_history_utils import (
+    _history_strings_to_model_messages,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_history_strings_map_role_prefixes_case_insensitively():
+    messages = _history_strings_to_model_messages(
+        ["HUMAN: hi there", "ai: hello", "AI_GENERATED: done", "", "legacy text"]
+    )
+
+    assert [type(m) for m in messages] == [
+        ModelRequest,
+        ModelResponse,
+        ModelResponse,
+        ModelResponse,
+    ]
+    assert messages[0].parts[0].content == "hi there"
+    assert messages[1].parts[0].content == "hello"
+    assert messages[2].parts[0].content == "done"
+    assert messages[3].parts[0].content == "legacy text"
+
+
+def test_history_model_messages_pass_through_unchanged():
+    request = ModelRequest(parts=[UserPromptPart(content="question")])
+    response = ModelResponse(parts=[TextPart(content="answer")])
+
+    messages = _history_strings_to_model_messages([request, "ai: next", response])
+
+    assert messages[0] is request
+    assert messages[2] is response
+    assert messages[1].parts[0].content == "next"
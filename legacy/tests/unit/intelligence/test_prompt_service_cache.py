@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.modules.intelligence.prompts import prompt_service as prompt_service_module
+from app.modules.intelligence.prompts.prompt_service import (
+    PromptService,
+    reset_enhanced_prompt_cache,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache():
+    reset_enhanced_prompt_cache()
+    yield
+    reset_enhanced_prompt_cache()
+
+
+@pytest.mark.asyncio
+async def test_enhance_prompt_reuses_result_for_repeated_query():
+    history = [SimpleNamespace(content="earlier question")]
+    provider = MagicMock()
+    provider.call_llm_with_structured_output = AsyncMock(
+        return_value=SimpleNamespace(enhancedprompt="enhanced query")
+    )
+
+    with patch.object(prompt_service_module, "ProviderService", return_value=provider):
+        service = PromptService(MagicMock())
+        first = await service.enhance_prompt("Fix the  bug", history, {"user_id": "u1"})
+        second = await service.enhance_prompt(
+            " Fix the bug ", history, {"user_id": "u1"}
+        )
+        other_user = await service.enhance_prompt(
+            "Fix the bug", history, {"user_id": "u2"}
+        )
+
+    assert first == second == other_user == "enhanced query"
+    assert provider.call_llm_with_structured_output.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_enhance_prompt_cache_key_is_case_sensitive():
+    history = [SimpleNamespace(content="earlier question")]
+    provider = MagicMock()
+    provider.call_llm_with_structured_output = AsyncMock(
+        side_effect=[
+            SimpleNamespace(enhancedprompt="rename FooBar in Src/Api.py"),
+            SimpleNamespace(enhancedprompt="rename foobar in src/api.py"),
+        ]
+    )
+
+    with patch.object(prompt_service_module, "ProviderService", return_value=provider):
+        service = PromptService(MagicMock())
+        upper = await service.enhance_prompt(
+            "rename FooBar in Src/Api.py", history, {"user_id": "u1"}
+        )
+        lower = await service.enhance_prompt(
+            "rename foobar in src/api.py", history, {"user_id": "u1"}
+        )
+
+    assert upper == "rename FooBar in Src/Api.py"
+    assert lower == "rename foobar in src/api.py"
+    assert provider.call_llm_with_structured_output.await_count == 2
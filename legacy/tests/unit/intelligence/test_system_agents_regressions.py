@@ -1,3 +1,4 @@
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -49,6 +50,60 @@ async def test_qna_agent_reuses_existing_file_structure_context():
     assert second.additional_context.count(FILE_STRUCTURE_HEADER.strip()) == 1
 
 
+@pytest.mark.asyncio
+async def test_qna_agent_fetches_node_code_and_structure_together():
+    from app.modules.intelligence.agents.chat_agents.system_agents.qna_agent import (
+        FILE_STRUCTURE_HEADER,
+        QnAAgent,
+    )
+
+    # Each fetch only completes once the other has started, so a serial
+    # implementation times out instead of passing.
+    code_started = asyncio.Event()
+    structure_started = asyncio.Event()
+
+    async def run_multiple(project_id, node_ids):
+        code_started.set()
+        await asyncio.wait_for(structure_started.wait(), timeout=1)
+        return "code snippet"
+
+    async def fetch_repo_structure(project_id):
+        structure_started.set()
+        await asyncio.wait_for(code_started.wait(), timeout=1)
+        return "repo tree"
+
+    tools_provider = MagicMock()
+    tools_provider.get_code_from_multiple_node_ids_tool.run_multiple = AsyncMock(
+        side_effect=run_multiple
+    )
+    tools_provider.file_structure_tool.fetch_repo_structure = AsyncMock(
+        side_effect=fetch_repo_structure
+    )
+
+    agent = QnAAgent(MagicMock(), tools_provider, MagicMock())
+    ctx = ChatContext(
+        project_id="project-1",
+        project_name="Project",
+        curr_agent_id="qna-agent",
+        history=[],
+        node_ids=["node-1"],
+        query="How does auth work?",
+    )
+
+    enriched = await agent._append_code_and_structure(ctx)
+
+    tools_provider.get_code_from_multiple_node_ids_tool.run_multiple.assert_awaited_once_with(
+        "project-1", ["node-1"]
+    )
+    tools_provider.file_structure_tool.fetch_repo_structure.assert_awaited_once_with(
+        "project-1"
+    )
+    context = enriched.additional_context
+    assert context.index("code snippet") < context.index(
+        f"{FILE_STRUCTURE_HEADER} repo tree"
+    )
+
+
 def test_specgen_agent_uses_registered_todo_tool_names():
     from app.modules.intelligence.agents.chat_agents.system_agents.specgen.spec_gen_agent import (
         SpecGenAgent,
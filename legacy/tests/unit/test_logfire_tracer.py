@@ -17,3 +17,39 @@ def test_logfire_trace_metadata_does_not_mask_inner_exception(monkeypatch):
     with pytest.raises(ValueError, match="original failure"):
         with logfire_tracer.logfire_trace_metadata(request_id="req-1"):
             raise ValueError("original failure")
+
+
+def test_logfire_llm_call_metadata_does_not_mask_inner_exception(monkeypatch):
+    events = []
+
+    class Recorder:
+        def __init__(self, name):
+            self.name = name
+
+        def __enter__(self):
+            events.append(f"enter:{self.name}")
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            events.append(f"exit:{self.name}")
+            return False
+
+    monkeypatch.setattr(
+        logfire_tracer.logfire, "set_baggage", lambda **_: Recorder("baggage")
+    )
+    monkeypatch.setattr(
+        logfire_tracer.logfire, "span", lambda *_args, **_kw: Recorder("span")
+    )
+
+    with pytest.raises(ValueError, match="llm failure"):
+        with logfire_tracer.logfire_llm_call_metadata(user_id="u1", environment="test"):
+            events.append("call")
+            raise ValueError("llm failure")
+
+    assert events == [
+        "enter:baggage",
+        "enter:span",
+        "call",
+        "exit:span",
+        "exit:baggage",
+    ]
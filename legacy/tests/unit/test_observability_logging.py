@@ -77,3 +77,14 @@ def test_standalone_preserves_service_name(monkeypatch):
 
     if standalone().service_name != "standalone-worker":
         raise AssertionError("standalone profile did not preserve SERVICE_NAME")
+
+
+def test_structured_logger_skips_rendering_for_disabled_levels():
+    logger = get_logger("test.observability.disabled")
+    logging.getLogger("test.observability.disabled").setLevel(logging.INFO)
+
+    class Expensive:
+        def __str__(self):
+            raise AssertionError("debug args were rendered while DEBUG is disabled")
+
+    logger.debug("payload: %s", Expensive())
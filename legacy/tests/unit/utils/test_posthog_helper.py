@@ -4,12 +4,19 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app.modules.utils.posthog_helper import PostHogClient
+from app.modules.utils.posthog_helper import PostHogClient, reset_posthog_client
 
 
 pytestmark = pytest.mark.unit
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_client():
+    reset_posthog_client()
+    yield
+    reset_posthog_client()
+
+
 class TestPostHogClientInit:
     def test_init_development_posthog_none(self):
         with patch.dict(os.environ, {"ENV": "development"}, clear=False):
@@ -28,6 +35,18 @@ class TestPostHogClientInit:
                 assert client.posthog is not None
                 mock_posthog.assert_called_once_with("key", host="https://app.posthog.com")
 
+    def test_init_production_reuses_shared_posthog(self):
+        with patch.dict(
+            os.environ,
+            {"ENV": "production", "POSTHOG_API_KEY": "key", "POSTHOG_HOST": "https://app.posthog.com"},
+            clear=False,
+        ):
+            with patch("app.modules.utils.posthog_helper.Posthog") as mock_posthog:
+                first = PostHogClient()
+                second = PostHogClient()
+                assert first.posthog is second.posthog
+                mock_posthog.assert_called_once()
+
 
 class TestPostHogClientSendEvent:
     def test_send_event_not_production_returns_early(self):
@@ -0,0 +1,66 @@
+"""Unit tests for TTLCache."""
+
+import pytest
+
+from app.modules.utils.ttl_cache import TTLCache
+
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_get_returns_value_until_ttl_expires(clock):
+    cache = TTLCache(ttl_seconds=10, max_entries=4, clock=clock)
+    cache.set("k", "v")
+
+    clock.now = 10
+    assert cache.get("k") == "v"
+
+    clock.now = 10.5
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_set_evicts_oldest_write_first(clock):
+    cache = TTLCache(ttl_seconds=10, max_entries=2, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 3)  # rewriting moves "a" behind "b"
+    cache.set("c", 4)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 3
+    assert cache.get("c") == 4
+
+
+def test_rewrite_refreshes_ttl(clock):
+    cache = TTLCache(ttl_seconds=10, max_entries=4, clock=clock)
+    cache.set("k", "v1")
+    clock.now = 8
+    cache.set("k", "v2")
+
+    clock.now = 15
+    assert cache.get("k") == "v2"
+
+
+def test_clear_drops_every_entry(clock):
+    cache = TTLCache(ttl_seconds=10, max_entries=4, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get("a") is None